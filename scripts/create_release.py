@@ -1,6 +1,7 @@
 import subprocess
 import sys
 import argparse
+import shlex
 import subprocess
 import tomllib  
 
@@ -15,14 +16,14 @@ import tomllib
 def verify_git_status():
     """Ensures the environment is clean and on the correct branch."""
     # 1. Check branch
-    current_branch = run_cmd("git rev-parse --abbrev-ref HEAD", dry_run=False)
+    current_branch = run_cmd(["git", "rev-parse", "--abbrev-ref", "HEAD"], dry_run=False)
     if current_branch != "main":
         print(f"[ERROR] You are on branch '{current_branch}'. Releases must happen on 'main'.")
         sys.exit(1)
 
     # 2. Check for uncommitted changes
     # --porcelain gives a stable, script-readable output. Empty string = clean.
-    status = run_cmd("git status --porcelain", dry_run=False)
+    status = run_cmd(["git", "status", "--porcelain"], dry_run=False)
     if status:
         print("[ERROR] Your working directory is dirty. Commit or stash changes before releasing.")
         print(f"Changes detected:\n{status}")
@@ -35,7 +36,7 @@ def check_permissions():
     try:
         # Get the current user's permission level for this repo
         # Result looks like: {"permission": "admin"}
-        perm_json = run_cmd("gh api repos/:owner/:repo/collaborators/{owner}/permission", dry_run=False)
+        perm_json = run_cmd(["gh", "api", "repos/:owner/:repo/collaborators/{owner}/permission"], dry_run=False)
         if '"permission":"admin"' not in perm_json.replace(" ", ""):
             print("[ERROR] Access Denied: You must have Admin permissions to release.")
             sys.exit(1)
@@ -60,15 +61,16 @@ def calculate_next_version(current, bump_type):
         return f"{major}.{minor}.{patch + 1}"
 
 def run_cmd(cmd, dry_run=False):
+    # cmd is an argv list; it is executed directly, without spawning a shell first
     if dry_run:
-        print(f"[DRY-RUN] Would execute: {cmd}")
+        print(f"[DRY-RUN] Would execute: {shlex.join(cmd)}")
         return None
     
     try:
-        result = subprocess.check_output(cmd, shell=True, text=True, stderr=subprocess.STDOUT)
+        result = subprocess.check_output(cmd, text=True, stderr=subprocess.STDOUT)
         return result.strip()
     except subprocess.CalledProcessError as e:
-        print(f"[ERROR] Error executing: {cmd}\n{e.output}")
+        print(f"[ERROR] Error executing: {shlex.join(cmd)}\n{e.output}")
         sys.exit(1)
 
 def run_update_snapshots(args):
@@ -81,18 +83,20 @@ def run_update_snapshots(args):
         print("\n[ERROR] 'make update_snapshots' failed!")
         if not args.dry_run:
             print("Reverting pyproject.toml...")
-            run_cmd("git checkout pyproject.toml")
+            run_cmd(["git", "checkout", "pyproject.toml"])
         sys.exit(1)
 
 def main():
-    check_permissions()
-    verify_git_status()
-        
     parser = argparse.ArgumentParser()
     parser.add_argument("version", nargs="?", default="patch")
     parser.add_argument("--dry-run", action="store_true")
     args = parser.parse_args()
 
+    # a dry run pushes nothing, so it skips the permission lookup and its GitHub API round-trip
+    if not args.dry_run:
+        check_permissions()
+    verify_git_status()
+
     current_v = get_current_version()
     
     if args.version in ["major", "minor", "patch"]:
@@ -104,7 +108,7 @@ def main():
     print(f"Starting {'DRY RUN ' if args.dry_run else ''}release: {current_v} -> {target_v}")
 
     # 1. Bump version in pyproject.toml
-    run_cmd(f"uv version {target_v}", args.dry_run)
+    run_cmd(["uv", "version", target_v], args.dry_run)
 
     # 2. Run Snapshots (Updates uv.lock, docs, etc.)
     if not args.dry_run:
@@ -114,21 +118,20 @@ def main():
 
     # 3. Commit EVERYTHING
     print(f"Committing changes for {tag}...")
-    run_cmd("git add .", args.dry_run) # Stages pyproject.toml, uv.lock, and snapshots
-    run_cmd(f'git commit -m "chore: bump version to {target_v} and update snapshots"', args.dry_run)
-    
-    # 4. Push Main first (Ensure the code is there before the tag)
-    print(f"Pushing code to main...")
-    run_cmd("git push origin main", args.dry_run)
+    run_cmd(["git", "add", "."], args.dry_run) # Stages pyproject.toml, uv.lock, and snapshots
+    run_cmd(["git", "commit", "-m", f"chore: bump version to {target_v} and update snapshots"], args.dry_run)
 
-    # 5. Tag and Push Tag
+    # 4. Tag the release commit
     print(f"Tagging {tag}...")
-    run_cmd(f"git tag -a {tag} -m \"Release {tag}\"", args.dry_run)
-    run_cmd("git push origin --tags", args.dry_run)
+    run_cmd(["git", "tag", "-a", tag, "-m", f"Release {tag}"], args.dry_run)
+
+    # 5. Push main and the tag in one atomic push, so the tag never lands without its commit
+    print(f"Pushing main and {tag}...")
+    run_cmd(["git", "push", "--atomic", "origin", "main", f"refs/tags/{tag}"], args.dry_run)
 
     # 6. Create GitHub Release
     print(f"Creating GitHub Release...")
-    run_cmd(f"gh release create {tag} --generate-notes", args.dry_run)
+    run_cmd(["gh", "release", "create", tag, "--generate-notes"], args.dry_run)
 
     if args.dry_run:
         print(f"\n[OK] Dry run complete.")
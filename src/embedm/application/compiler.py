@@ -50,7 +50,7 @@ def _compile_plan_node(plan_root: PlanNode, context: EmbedmContext, compiled_dir
         max_embed_size=context.config.max_embed_size,
         max_recursion=context.config.max_recursion,
         compiled_dir=compiled_dir,
-        plugin_sequence=build_directive_sequence(context.config.plugin_sequence, context.plugin_registry),
+        plugin_sequence=_get_directive_sequence(context),
         plugin_settings=context.config.plugin_configuration,
     )
     node_total = count_nodes(plan_root)
@@ -81,6 +81,13 @@ def _compile_plan_node(plan_root: PlanNode, context: EmbedmContext, compiled_dir
     return result
 
 
+def _get_directive_sequence(context: EmbedmContext) -> tuple[str, ...]:
+    """Return the directive pass order, resolving it once per context rather than per compiled file."""
+    if context.directive_sequence is None:
+        context.directive_sequence = build_directive_sequence(context.config.plugin_sequence, context.plugin_registry)
+    return context.directive_sequence
+
+
 def build_directive_sequence(plugin_sequence: list[str], registry: PluginRegistry) -> tuple[str, ...]:
     """Return directive types ordered by plugin_sequence module order.
 
@@ -89,11 +96,10 @@ def build_directive_sequence(plugin_sequence: list[str], registry: PluginRegistr
     result: list[str] = []
     covered: set[str] = set()
     for module in plugin_sequence:
-        for plugin in registry.lookup.values():
-            if plugin.__class__.__module__ == module and plugin.directive_type not in covered:
-                result.append(plugin.directive_type)
-                covered.add(plugin.directive_type)
-                break
+        plugin = registry.find_plugin_by_module(module)
+        if plugin is not None and plugin.directive_type not in covered:
+            result.append(plugin.directive_type)
+            covered.add(plugin.directive_type)
     for plugin in registry.lookup.values():
         if plugin.directive_type not in covered:
             result.append(plugin.directive_type)
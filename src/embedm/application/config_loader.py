@@ -6,6 +6,7 @@ from typing import Any
 import yaml
 
 from embedm.domain.status_level import Status, StatusLevel
+from embedm.parsing.yaml_loader import load_yaml
 
 from .application_resources import str_resources
 from .configuration import (
@@ -54,13 +55,8 @@ root_directive_type: {DEFAULT_ROOT_DIRECTIVE_TYPE}
 plugin_sequence:
 """
 
-
-def _build_default_template() -> str:
-    """Build the full default config template including the plugin sequence list."""
-    lines = _DEFAULT_CONFIG_TEMPLATE
-    for plugin in DEFAULT_PLUGIN_SEQUENCE:
-        lines += f"  - {plugin}\n"
-    return lines
+# full default config file text, including the plugin sequence list; built once at import
+_DEFAULT_CONFIG_YAML = _DEFAULT_CONFIG_TEMPLATE + "".join(f"  - {plugin}\n" for plugin in DEFAULT_PLUGIN_SEQUENCE)
 
 
 def generate_default_config(directory: str) -> tuple[str, list[Status]]:
@@ -70,10 +66,13 @@ def generate_default_config(directory: str) -> tuple[str, list[Status]]:
         return "", [Status(StatusLevel.ERROR, str_resources.err_config_no_dir.format(directory=directory))]
 
     config_path = dir_path / CONFIG_FILE_NAME
-    if config_path.exists():
+    # exclusive create: the open fails if the file exists, so no separate existence check is needed
+    try:
+        with config_path.open("x", encoding="utf-8") as f:
+            f.write(_DEFAULT_CONFIG_YAML)
+    except FileExistsError:
         return "", [Status(StatusLevel.ERROR, str_resources.err_config_dir_exist.format(config_path=config_path))]
 
-    config_path.write_text(_build_default_template(), encoding="utf-8")
     return str(config_path), []
 
 
@@ -82,8 +81,13 @@ def load_config_file(path: str) -> tuple[Configuration, list[Status]]:
     if not config_path.is_file():
         return Configuration(), [Status(StatusLevel.ERROR, str_resources.err_config_no_file.format(path=path))]
 
+    text = config_path.read_text(encoding="utf-8")
+    # an empty or whitespace-only file means all defaults; no need to start the parser
+    if not text.strip():
+        return Configuration(), []
+
     try:
-        raw = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        raw = load_yaml(text)
     except yaml.YAMLError as e:
         return Configuration(), [Status(StatusLevel.ERROR, f"failed to parse '{path}': {e}")]
 
@@ -170,9 +174,13 @@ def _parse_config(raw: dict[str, Any]) -> tuple[Configuration, list[Status]]:
 
 
 def _validate_special_overrides(overrides: dict[str, Any]) -> list[Status]:
-    """Validate plugin_configuration and line_endings fields, removing invalid entries in-place."""
+    """Validate plugin_sequence, plugin_configuration and line_endings fields, removing invalid entries in-place."""
     errors: list[Status] = []
 
+    if "plugin_sequence" in overrides and not all(isinstance(entry, str) for entry in overrides["plugin_sequence"]):
+        errors.append(Status(StatusLevel.ERROR, "config key 'plugin_sequence' must be a list of module names"))
+        del overrides["plugin_sequence"]
+
     if "plugin_configuration" in overrides:
         plugin_cfg_errors = _validate_plugin_config_structure(overrides["plugin_configuration"])
         errors.extend(plugin_cfg_errors)
@@ -9,6 +9,14 @@ from embedm.application.application_resources import str_resources
 from embedm.domain.plan_node import PlanNode
 from embedm.domain.status_level import Status, StatusLevel
 
+# plan-tree label per status level; StatusLevel values increase with severity
+_STATUS_LABELS: dict[StatusLevel, str] = {
+    StatusLevel.OK: "OK",
+    StatusLevel.WARNING: "WARN",
+    StatusLevel.ERROR: "ERROR",
+    StatusLevel.FATAL: "FATAL",
+}
+
 
 class ContinueChoice(Enum):
     YES = "yes"
@@ -17,6 +25,17 @@ class ContinueChoice(Enum):
     EXIT = "exit"
 
 
+# accepted prompt answers; anything else means NO
+_CONTINUE_RESPONSES: dict[str, ContinueChoice] = {
+    "a": ContinueChoice.ALWAYS,
+    "always": ContinueChoice.ALWAYS,
+    "y": ContinueChoice.YES,
+    "yes": ContinueChoice.YES,
+    "x": ContinueChoice.EXIT,
+    "exit": ContinueChoice.EXIT,
+}
+
+
 @dataclass
 class RunSummary:
     """Tracks per-run output counts for the summary line."""
@@ -39,13 +58,7 @@ def prompt_continue() -> ContinueChoice:
         return ContinueChoice.EXIT
     try:
         response = input(str_resources.continue_compilation).strip().lower()
-        if response in ("a", "always"):
-            return ContinueChoice.ALWAYS
-        if response in ("y", "yes"):
-            return ContinueChoice.YES
-        if response in ("x", "exit"):
-            return ContinueChoice.EXIT
-        return ContinueChoice.NO
+        return _CONTINUE_RESPONSES.get(response, ContinueChoice.NO)
     except (EOFError, KeyboardInterrupt):
         return ContinueChoice.EXIT
 
@@ -113,13 +126,8 @@ def _vprint(line: str) -> None:
 
 
 def _worst_status_label(statuses: list[Status]) -> str:
-    if any(s.level == StatusLevel.FATAL for s in statuses):
-        return "FATAL"
-    if any(s.level == StatusLevel.ERROR for s in statuses):
-        return "ERROR"
-    if any(s.level == StatusLevel.WARNING for s in statuses):
-        return "WARN"
-    return "OK"
+    worst = max((s.level.value for s in statuses), default=StatusLevel.OK.value)
+    return _STATUS_LABELS[StatusLevel(worst)]
 
 
 def _format_summary(summary: RunSummary) -> str:
@@ -14,3 +14,5 @@ class EmbedmContext:
     plugin_registry: PluginRegistry
     accept_all: bool = False
     events: EventDispatcher = field(default_factory=EventDispatcher)
+    # compile pass order resolved from config.plugin_sequence, filled in on first compile
+    directive_sequence: tuple[str, ...] | None = None
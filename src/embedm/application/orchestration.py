@@ -193,8 +193,8 @@ def _process_directory(config: Configuration, context: EmbedmContext, summary: R
         return
 
     base_dir = extract_base_dir(config.input)
-    plan_results = _plan_all_files(files, config, context)
-    _compile_all_files(plan_results, base_dir, config, context, summary)
+    compile_targets = _plan_all_files(files, config, context)
+    _compile_all_files(compile_targets, base_dir, config, context, summary)
 
 
 def _plan_all_files(
@@ -202,9 +202,14 @@ def _plan_all_files(
     config: Configuration,
     context: EmbedmContext,
 ) -> list[tuple[str, PlanNode]]:
-    """Plan every discovered file, emitting planning events. Returns (file_path, plan_root) pairs."""
+    """Plan every discovered file, emitting planning events.
+
+    Returns the (file_path, plan_root) pairs to compile: planned files that no other planned file embeds.
+    """
     context.events.emit(PlanningStarted(file_count=len(files)))
     plan_results: list[tuple[str, PlanNode]] = []
+    # resolved path of each entry in plan_results, kept in step so compile filtering needs no second resolve
+    resolved_paths: list[str] = []
     embedded: set[str] = set()
     plan_error_count = 0
 
@@ -220,30 +225,26 @@ def _plan_all_files(
             context.events.emit(FilePlanError(file_path=file_path, index=i, total=len(files), message=msg))
             plan_error_count += 1
             plan_results.append((file_path, plan_root))
+            resolved_paths.append(resolved)
             if not _should_continue_after_error(context):
                 break
         else:
             context.events.emit(FilePlanned(file_path=file_path, index=i, total=len(files)))
             plan_results.append((file_path, plan_root))
+            resolved_paths.append(resolved)
 
     context.events.emit(PlanningComplete(file_count=len(plan_results), error_count=plan_error_count))
-    return plan_results
+    return [result for result, resolved in zip(plan_results, resolved_paths, strict=True) if resolved not in embedded]
 
 
 def _compile_all_files(
-    plan_results: list[tuple[str, PlanNode]],
+    compile_targets: list[tuple[str, PlanNode]],
     base_dir: Path,
     config: Configuration,
     context: EmbedmContext,
     summary: RunSummary,
 ) -> None:
     """Compile the planned files that are not embedded dependencies of other files."""
-    embedded: set[str] = set()
-    for _, plan_root in plan_results:
-        embedded.update(collect_embedded_sources(plan_root, embed_type=config.root_directive_type))
-
-    compile_targets = [(fp, pr) for fp, pr in plan_results if str(Path(fp).resolve()) not in embedded]
-
     context.events.emit(CompilationStarted(file_count=len(compile_targets)))
 
     for i, (file_path, plan_root) in enumerate(compile_targets):
@@ -408,7 +409,7 @@ def _validate_plugin_config_schemas(config: Configuration, registry: PluginRegis
     """Validate per-plugin config sections against each plugin's declared schema."""
     errors: list[Status] = []
     for module, settings in config.plugin_configuration.items():
-        plugin = next((p for p in registry.lookup.values() if p.__class__.__module__ == module), None)
+        plugin = registry.find_plugin_by_module(module)
         if plugin is None:
             errors.append(
                 Status(StatusLevel.WARNING, app_resources.warn_plugin_config_unknown_module.format(module=module))
@@ -12,16 +12,24 @@ from embedm.plugins.plugin_registry import PluginRegistry
 from .application_resources import str_resources
 from .embedm_context import EmbedmContext
 
+# pseudo-source for content read from stdin; the .md suffix makes the file plugin emit it unfenced
+_STDIN_SOURCE = "<stdin>.md"
+
 
 def plan_content(content: str, context: EmbedmContext) -> PlanNode:
-    """Create a plan for raw content, using cwd as the base directory."""
-    source = str(Path.cwd() / "<stdin>")
+    """Create a plan for raw content, using cwd as the base directory.
+
+    The content is registered under a markdown pseudo-source so the root renders as a document.
+    """
+    source = str(Path.cwd() / _STDIN_SOURCE)
+    # the root transform reads its source through the file cache, so serve the content from memory
+    context.file_cache.add_content(source, content)
     root_directive = Directive(type=context.config.root_directive_type, source=source)
     plugin_config = PluginConfiguration(
         max_embed_size=context.config.max_embed_size,
         max_recursion=context.config.max_recursion,
     )
-    return _validate_and_plan(root_directive, content, 0, frozenset(), context, plugin_config)
+    return _validate_and_plan(root_directive, content, 0, set(), context, plugin_config)
 
 
 def plan_file(file_name: str, context: EmbedmContext) -> PlanNode:
@@ -38,7 +46,7 @@ def plan_file(file_name: str, context: EmbedmContext) -> PlanNode:
         max_embed_size=context.config.max_embed_size,
         max_recursion=context.config.max_recursion,
     )
-    return _validate_and_plan(root_directive, content, 0, frozenset({resolved}), context, plugin_config)
+    return _validate_and_plan(root_directive, content, 0, {resolved}, context, plugin_config)
 
 
 def create_plan(
@@ -46,9 +54,15 @@ def create_plan(
     content: str,
     depth: int,
     context: EmbedmContext,
-    ancestors: frozenset[str] = frozenset(),
+    ancestors: set[str] | None = None,
 ) -> PlanNode:
-    """Build a validated plan tree from content, collecting all errors without short-circuiting."""
+    """Build a validated plan tree from content, collecting all errors without short-circuiting.
+
+    ancestors is the cycle-detection set of sources on the current path; it is extended while
+    a child is planned and restored afterwards, so callers get it back unchanged.
+    """
+    if ancestors is None:
+        ancestors = set()
     all_errors: list[Status] = []
 
     # step 1: parse content into fragments, resolving relative sources against parent directory
@@ -128,7 +142,7 @@ def _check_plugins(
 def _check_sources(
     directives: list[Directive],
     depth: int,
-    ancestors: frozenset[str],
+    ancestors: set[str],
     context: EmbedmContext,
 ) -> tuple[list[Directive], list[PlanNode]]:
     """Check source directives for cycles, depth, and file access.
@@ -149,7 +163,7 @@ def _check_sources(
 def _validate_source(
     directive: Directive,
     depth: int,
-    ancestors: frozenset[str],
+    ancestors: set[str],
     context: EmbedmContext,
 ) -> Status | None:
     """Check a single source directive for cycles, depth, and file access. Returns error or None."""
@@ -188,7 +202,7 @@ def _validate_sourceless_directives(
 def _build_children(
     directives: list[Directive],
     depth: int,
-    ancestors: frozenset[str],
+    ancestors: set[str],
     context: EmbedmContext,
     plugin_config: PluginConfiguration,
 ) -> list[PlanNode]:
@@ -199,7 +213,7 @@ def _build_children(
 def _build_child(
     directive: Directive,
     depth: int,
-    ancestors: frozenset[str],
+    ancestors: set[str],
     context: EmbedmContext,
     plugin_config: PluginConfiguration,
 ) -> PlanNode:
@@ -208,16 +222,19 @@ def _build_child(
     if load_errors or source_content is None:
         errors = load_errors or [Status(StatusLevel.ERROR, f"failed to load '{to_relative(directive.source)}'")]
         return _error_node(directive, errors)
-    return _validate_and_plan(
-        directive, source_content, depth + 1, ancestors | {directive.source}, context, plugin_config
-    )
+    # push/pop on the shared set instead of copying it for every child
+    ancestors.add(directive.source)
+    try:
+        return _validate_and_plan(directive, source_content, depth + 1, ancestors, context, plugin_config)
+    finally:
+        ancestors.discard(directive.source)
 
 
 def _validate_and_plan(
     directive: Directive,
     content: str,
     depth: int,
-    ancestors: frozenset[str],
+    ancestors: set[str],
     context: EmbedmContext,
     plugin_config: PluginConfiguration,
 ) -> PlanNode:
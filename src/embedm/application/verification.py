@@ -16,8 +16,13 @@ class VerifyStatus(Enum):
 
 def verify_file_output(result: str, output_path: str, config: Configuration) -> VerifyStatus:
     """Compare compiled result against the existing file on disk without writing."""
-    normalised = apply_line_endings(result, config.line_endings).encode("utf-8")
+    normalised = apply_line_endings(result, config.line_endings)
     path = Path(output_path)
     if not path.exists():
         return VerifyStatus.MISSING
-    return VerifyStatus.UP_TO_DATE if path.read_bytes() == normalised else VerifyStatus.STALE
+    # a UTF-8 encoding takes 1 to 4 bytes per character: a file size outside that band is stale
+    # without reading the file or encoding the result
+    disk_size = path.stat().st_size
+    if not len(normalised) <= disk_size <= 4 * len(normalised):
+        return VerifyStatus.STALE
+    return VerifyStatus.UP_TO_DATE if path.read_bytes() == normalised.encode("utf-8") else VerifyStatus.STALE
@@ -1,5 +1,6 @@
 import glob
 import os
+import stat
 import time
 from collections import OrderedDict
 from enum import Enum
@@ -13,6 +14,9 @@ from embedm.infrastructure.file_util import to_relative
 
 from .infrastructure_resources import str_resources
 
+# characters that make an allowed path a wildcard pattern (see fnmatch)
+_WILDCARD_CHARS = frozenset("*?[")
+
 
 class WriteMode(Enum):
     OVERWRITE = 1
@@ -30,6 +34,7 @@ class FileCache:
     LRU file cache with memory management and path access control.
 
     Allowed paths may contain wildcards (* and **) for pattern matching.
+    They are resolved once, against the working directory at construction time.
     """
 
     def __init__(
@@ -47,11 +52,19 @@ class FileCache:
         self.max_file_size = max_file_size
         self.memory_limit = memory_limit
         self.allowed_paths = allowed_paths
+        allowed_resolved = [Path(allowed).resolve() for allowed in allowed_paths]
+        self._allowed_roots = frozenset(os.path.normcase(str(p)) for p in allowed_resolved)
+        # root + separator, computed once so the subdirectory test is a single str.startswith
+        self._allowed_prefixes = tuple(r if r.endswith(os.sep) else r + os.sep for r in self._allowed_roots)
+        self._allowed_patterns = [str(p) for p in allowed_resolved if _WILDCARD_CHARS.intersection(str(p))]
+        self._resolved_paths: dict[str, Path] = {}
         self.write_mode = write_mode
         self.max_embed_size = max_embed_size
         self._events = events
         self._cache: OrderedDict[str, str | None] = OrderedDict()
         self._memory_in_use = 0
+        # content registered from memory (e.g. stdin); never read from disk and never evicted
+        self._in_memory: dict[str, str] = {}
 
     def validate(self, path: str) -> list[Status]:
         """
@@ -59,20 +72,25 @@ class FileCache:
         and matches the allowed paths. Pure check with no side effects.
         Skips filesystem checks if already in cache.
         """
-        if path in self._cache:
+        if path in self._cache or path in self._in_memory:
             return []
 
         errors: list[Status] = []
 
-        if not _is_path_allowed(path, self.allowed_paths):
+        if not self._is_allowed(path):
             errors.append(Status(StatusLevel.FATAL, f"path is not in allowed paths: '{to_relative(path)}'"))
             return errors
 
-        if not os.path.isfile(path):
+        # a single stat covers both the existence and the size check
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            stat_result = None
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
             errors.append(Status(StatusLevel.ERROR, f"file does not exist: '{to_relative(path)}'"))
             return errors
 
-        file_size = os.path.getsize(path)
+        file_size = stat_result.st_size
         if file_size > self.max_file_size:
             errors.append(
                 Status(
@@ -93,6 +111,10 @@ class FileCache:
         If loading would exceed memory_limit, evicts least recently used
         loaded entries until there is room.
         """
+        in_memory = self._in_memory.get(path)
+        if in_memory is not None:
+            return in_memory, []
+
         # return cached content if loaded
         if path in self._cache and self._cache[path] is not None:
             self._cache.move_to_end(path, last=False)
@@ -108,7 +130,7 @@ class FileCache:
 
         # load from disk
         t0 = time.perf_counter()
-        content = Path(path).read_text(encoding="utf-8")
+        content = _read_text(path)
         elapsed_s = time.perf_counter() - t0
         self._make_room(len(content))
         self._cache[path] = content
@@ -132,14 +154,14 @@ class FileCache:
         Returns the actual file path written to and any errors.
         The written file is added to the cache.
         """
-        if not _is_path_allowed(path, self.allowed_paths):
+        if not self._is_allowed(path):
             return None, [Status(StatusLevel.FATAL, str_resources.err_path_not_allowed.format(path=to_relative(path)))]
 
-        actual_path = path
-        if os.path.isfile(path) and self.write_mode == WriteMode.CREATE_NEW:
-            actual_path = _find_next_available_path(path)
-
-        Path(actual_path).write_text(content, encoding="utf-8")
+        if self.write_mode == WriteMode.CREATE_NEW:
+            actual_path = _write_new(path, content)
+        else:
+            actual_path = path
+            Path(actual_path).write_text(content, encoding="utf-8")
 
         self._make_room(len(content))
         self._cache[actual_path] = content
@@ -148,6 +170,15 @@ class FileCache:
 
         return actual_path, []
 
+    def add_content(self, path: str, content: str) -> None:
+        """
+        Register content that is already in memory under path.
+
+        get_file serves it without touching the filesystem. Used for sources
+        that have no file behind them, such as stdin input.
+        """
+        self._in_memory[path] = content
+
     def get_file_state(self, path: str) -> FileState:
         """Check whether the path exists in the cache and its load state."""
         if path not in self._cache:
@@ -169,16 +200,29 @@ class FileCache:
         errors: list[Status] = []
 
         for file_path in matched:
-            resolved = str(Path(file_path).resolve())
-            if _is_path_allowed(resolved, self.allowed_paths):
-                files.append(resolved)
+            resolved = self._resolve(file_path)
+            if _is_path_allowed(resolved, self._allowed_roots, self._allowed_prefixes, self._allowed_patterns):
+                files.append(str(resolved))
             else:
                 errors.append(
-                    Status(StatusLevel.ERROR, f"matched file is not in allowed paths: '{to_relative(resolved)}'")
+                    Status(StatusLevel.ERROR, f"matched file is not in allowed paths: '{to_relative(str(resolved))}'")
                 )
 
         return files, errors
 
+    def _resolve(self, path: str) -> Path:
+        """Return the resolved path, resolving each distinct path string only once."""
+        resolved = self._resolved_paths.get(path)
+        if resolved is None:
+            resolved = Path(path).resolve()
+            self._resolved_paths[path] = resolved
+        return resolved
+
+    def _is_allowed(self, path: str) -> bool:
+        return _is_path_allowed(
+            self._resolve(path), self._allowed_roots, self._allowed_prefixes, self._allowed_patterns
+        )
+
     def _make_room(self, needed: int) -> None:
         """Evict least recently used loaded entries until there is room."""
         while self._memory_in_use + needed > self.memory_limit:
@@ -199,32 +243,47 @@ class FileCache:
         return False
 
 
-def _is_path_allowed(path: str, allowed_paths: list[str]) -> bool:
-    """Check if a path matches any of the allowed path patterns."""
-    resolved = Path(path).resolve()
-    for allowed in allowed_paths:
-        allowed_resolved = Path(allowed).resolve()
-        # directory boundary match (exact match or subdirectory)
-        try:
-            resolved.relative_to(allowed_resolved)
-            return True
-        except ValueError:
-            pass
-        # wildcard match
-        if fnmatch(str(resolved), str(allowed_resolved)):
-            return True
-    return False
-
-
-def _find_next_available_path(path: str) -> str:
-    """Find the next available numbered path: file.N.ext."""
+def _is_path_allowed(
+    resolved: Path,
+    allowed_roots: frozenset[str],
+    allowed_prefixes: tuple[str, ...],
+    allowed_patterns: list[str],
+) -> bool:
+    """Check if a resolved path is under an allowed root or matches an allowed wildcard pattern."""
+    resolved_str = str(resolved)
+    # directory boundary match (exact match or subdirectory); prefixes end in a separator
+    key = os.path.normcase(resolved_str)
+    if key in allowed_roots or key.startswith(allowed_prefixes):
+        return True
+    return any(fnmatch(resolved_str, pattern) for pattern in allowed_patterns)
+
+
+def _read_text(path: str) -> str:
+    """Read a UTF-8 file with universal newlines, decoding it in one call.
+
+    Newline translation is skipped when the content has no carriage returns.
+    """
+    # unbuffered: the whole file is read in one readall() sized from fstat, so a read buffer is never used
+    with open(path, "rb", buffering=0) as f:
+        content = f.read().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _write_new(path: str, content: str) -> str:
+    """Write content to path, or to the next available numbered path (file.N.ext) if it exists.
+
+    Files are opened in exclusive-create mode, so the open itself is the existence check.
+    """
     p = Path(path)
-    stem = p.stem
-    suffix = p.suffix
-    parent = p.parent
+    candidate = p
     counter = 0
     while True:
-        candidate = parent / f"{stem}.{counter}{suffix}"
-        if not candidate.exists():
+        try:
+            with candidate.open("x", encoding="utf-8") as f:
+                f.write(content)
             return str(candidate)
-        counter += 1
+        except FileExistsError:
+            candidate = p.parent / f"{p.stem}.{counter}{p.suffix}"
+            counter += 1
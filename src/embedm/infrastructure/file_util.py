@@ -1,3 +1,6 @@
+import os
+from collections.abc import Iterator
+from fnmatch import fnmatch
 from pathlib import Path
 
 
@@ -34,7 +37,28 @@ def extract_base_dir(input_path: str) -> Path:
 def expand_directory_input(input_path: str, pattern: str = "*.md") -> list[str]:
     """Expand a directory or glob pattern to a sorted list of matching files."""
     if "**" in input_path:
-        return sorted(str(p) for p in glob_base(input_path).rglob(pattern))
+        return sorted(_walk_matches(glob_base(input_path), pattern))
     if "*" in input_path:
         return sorted(str(p) for p in glob_base(input_path).glob(pattern))
     return sorted(str(p) for p in Path(input_path).glob(pattern))
+
+
+def _walk_matches(base: Path, pattern: str) -> Iterator[str]:
+    """Yield the paths below base whose name matches pattern, like Path.rglob.
+
+    Walks with os.scandir so only matching entries become Path objects. Symlinked
+    directories are not descended and unreadable directories are skipped, as with rglob.
+    """
+    stack = [str(base)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if fnmatch(entry.name, pattern):
+                    # via Path so the result reads exactly as rglob's would (e.g. no "./" prefix)
+                    yield str(Path(entry.path))
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
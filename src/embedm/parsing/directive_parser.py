@@ -11,6 +11,7 @@ from embedm.domain.span import Span
 from embedm.domain.status_level import Status, StatusLevel
 
 from .parsing_resources import str_resources
+from .yaml_loader import load_yaml
 
 EMBEDM_FENCE_PATTERN = re.compile(r"^```yaml embedm\s*$", re.MULTILINE)
 CLOSING_FENCE_PATTERN = re.compile(r"^```[ \t]*$", re.MULTILINE)
@@ -33,7 +34,7 @@ def parse_yaml_embed_block(content: str, base_dir: str = "") -> tuple[Directive
         return None, [Status(StatusLevel.ERROR, "empty embedm block")]
 
     try:
-        parsed = yaml.safe_load(content)
+        parsed = load_yaml(content)
     except yaml.YAMLError as exc:
         return None, [Status(StatusLevel.ERROR, f"invalid YAML in embedm block: {exc}")]
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 
 DEFAULT_REGION_START = "md.start:{tag}"
@@ -10,6 +11,7 @@ DEFAULT_REGION_END = "md.end:{tag}"
 _REGION_COMMENT_PREFIX = r"(?:#|//|<!--|/\*)"
 
 
+@functools.lru_cache(maxsize=32)
 def _compile_region_pattern(template: str) -> re.Pattern[str]:
     """Build a region marker regex from a template containing {tag}.
 
@@ -17,22 +19,48 @@ def _compile_region_pattern(template: str) -> re.Pattern[str]:
     Example: "md.start:{tag}" → matches lines like "# md.start: myregion".
     """
     prefix = template.split("{tag}")[0]
+    # the pattern scans whole text in multiline mode, so whitespace must not run across newlines
     return re.compile(
-        r"^\s*" + _REGION_COMMENT_PREFIX + r"\s*" + re.escape(prefix) + r"\s*(?P<name>\S+)",
-        re.IGNORECASE,
+        r"^[^\S\n]*" + _REGION_COMMENT_PREFIX + r"[^\S\n]*" + re.escape(prefix) + r"[^\S\n]*(?P<name>\S+)",
+        re.IGNORECASE | re.MULTILINE,
     )
 
 
-_REGION_START = _compile_region_pattern(DEFAULT_REGION_START)
-_REGION_END = _compile_region_pattern(DEFAULT_REGION_END)
-
 _SINGLE_LINE = re.compile(r"^\d+$")
 _LINE_RANGE = re.compile(r"^(\d*)\.\.(\d*)$")
 
 
-def _matches_region(line: str, name: str, pattern: re.Pattern[str]) -> bool:
-    m = pattern.match(line)
-    return bool(m and m.group("name") == name)
+def split_lines(content: str) -> tuple[str, ...]:
+    """Split content into lines, treating CRLF as LF."""
+    return tuple(content.replace("\r\n", "\n").split("\n"))
+
+
+def _region_index(content: str, start_template: str, end_template: str) -> dict[str, tuple[int, int]]:
+    """Map each terminated region name to its (first, end) line slice bounds in a single pass.
+
+    A region runs from its first start marker to the first end marker for that name on a later line.
+    Markers are located with one regex scan over the whole text rather than a match per line.
+    """
+    text = content.replace("\r\n", "\n")
+    # (offset, is_start, name); on a shared line the end marker sorts first, so a region never ends
+    # on its own start line
+    markers = sorted(
+        [(m.start(), False, m.group("name")) for m in _compile_region_pattern(end_template).finditer(text)]
+        + [(m.start(), True, m.group("name")) for m in _compile_region_pattern(start_template).finditer(text)]
+    )
+    starts: dict[str, int] = {}
+    regions: dict[str, tuple[int, int]] = {}
+    line, scanned = 0, 0
+
+    for offset, is_start, name in markers:
+        line += text.count("\n", scanned, offset)
+        scanned = offset
+        if is_start:
+            starts.setdefault(name, line + 1)
+        elif name in starts and name not in regions:
+            regions[name] = (starts[name], line)
+
+    return regions
 
 
 def extract_region(
@@ -49,28 +77,22 @@ def extract_region(
     Returns the lines between the markers (exclusive of marker lines), or None if
     the region is not found or is not properly terminated.
     """
-    start_pat = _REGION_START if start_template == DEFAULT_REGION_START else _compile_region_pattern(start_template)
-    end_pat = _REGION_END if end_template == DEFAULT_REGION_END else _compile_region_pattern(end_template)
-
-    lines = content.replace("\r\n", "\n").split("\n")
-    name = region_name.strip()
-    start_idx: int = -1
-
-    for i, line in enumerate(lines):
-        if start_idx == -1:
-            if _matches_region(line, name, start_pat):
-                start_idx = i + 1
-        else:
-            if _matches_region(line, name, end_pat):
-                return lines[start_idx:i]
-
-    return None
+    bounds = _region_index(content, start_template, end_template).get(region_name.strip())
+    if bounds is None:
+        return None
+    return list(split_lines(content)[bounds[0] : bounds[1]])
 
 
-def _parse_line_range_bounds(m: re.Match[str], total: int) -> tuple[int, int]:
-    start = int(m.group(1)) if m.group(1) else 1
-    end = int(m.group(2)) if m.group(2) else total
-    return start, end
+@functools.lru_cache(maxsize=128)
+def _parse_line_range(range_str: str) -> tuple[int | None, int | None] | None:
+    """Parse a range expression into (start, end); None marks an open bound. Memoized per string."""
+    if _SINGLE_LINE.fullmatch(range_str):
+        line = int(range_str)
+        return line, line
+    m = _LINE_RANGE.fullmatch(range_str)
+    if not m:
+        return None
+    return (int(m.group(1)) if m.group(1) else None, int(m.group(2)) if m.group(2) else None)
 
 
 def _is_range_valid(start: int, end: int, total: int) -> bool:
@@ -84,24 +106,22 @@ def extract_line_range(content: str, range_str: str) -> list[str] | None:
     '10..' (from line to end), '..10' (from start to line). Line numbers are 1-based.
     Returns the selected lines, or None if the format is unrecognised or out of bounds.
     """
-    lines = content.replace("\r\n", "\n").split("\n")
-    total = len(lines)
+    content = content.replace("\r\n", "\n")
+    # count lines instead of splitting them all; only the lines up to the range end are split below
+    total = content.count("\n") + 1
 
-    if _SINGLE_LINE.fullmatch(range_str):
-        n = int(range_str)
-        return lines[n - 1 : n] if 1 <= n <= total else None
-
-    m = _LINE_RANGE.fullmatch(range_str)
-    if not m:
+    bounds = _parse_line_range(range_str)
+    if bounds is None:
         return None
-
-    start, end = _parse_line_range_bounds(m, total)
+    start = 1 if bounds[0] is None else bounds[0]
+    end = total if bounds[1] is None else bounds[1]
     if not _is_range_valid(start, end, total):
         return None
 
-    return lines[start - 1 : end]
+    # maxsplit leaves everything after line `end` as one trailing chunk, which the slice drops
+    return content.split("\n", end)[start - 1 : end]
 
 
 def is_valid_line_range(range_str: str) -> bool:
     """Return True if range_str is a syntactically valid line range expression."""
-    return bool(_SINGLE_LINE.fullmatch(range_str) or _LINE_RANGE.fullmatch(range_str))
+    return _parse_line_range(range_str) is not None
@@ -12,10 +12,14 @@ Architecture (bottom to top):
 
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from embedm.parsing.extraction import split_lines
+
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
@@ -164,7 +168,7 @@ def _scan_line(line: str, state: _ScanState, style: CommentStyle) -> tuple[str,
 # ---------------------------------------------------------------------------
 
 
-def _extract_block_brace(lines: list[str], start_idx: int, style: CommentStyle) -> int:
+def _extract_block_brace(lines: Sequence[str], start_idx: int, style: CommentStyle) -> int:
     """Find the closing brace of a brace-delimited block.
 
     Scans from start_idx for the first '{', then tracks nesting depth until
@@ -191,12 +195,12 @@ def _extract_block_brace(lines: list[str], start_idx: int, style: CommentStyle)
     raise ValueError(f"no matching closing brace from line {start_idx + 1}")
 
 
-def _extract_block_rest_of_file(lines: list[str], _start_idx: int, _style: CommentStyle) -> int:
+def _extract_block_rest_of_file(lines: Sequence[str], _start_idx: int, _style: CommentStyle) -> int:
     """Block extends to the end of the file (e.g. C# file-scoped namespace)."""
     return len(lines) - 1
 
 
-def _extract_block_indent(lines: list[str], start_idx: int, _style: CommentStyle) -> int:
+def _extract_block_indent(lines: Sequence[str], start_idx: int, _style: CommentStyle) -> int:
     """Find the end of a Python indentation-delimited block.
 
     Scans from start_idx + 1 for lines whose indentation exceeds the declaration
@@ -215,7 +219,7 @@ def _extract_block_indent(lines: list[str], start_idx: int, _style: CommentStyle
     return last_body_idx
 
 
-def _get_base_indent(lines: list[str], range_start: int, range_end: int) -> int:
+def _get_base_indent(lines: Sequence[str], range_start: int, range_end: int) -> int:
     """Return the indentation of the first non-blank line in the given range."""
     for idx in range(range_start, range_end + 1):
         if lines[idx].strip():
@@ -230,7 +234,7 @@ def _is_at_base_indent(line: str, base_indent: int) -> bool:
     return len(line) - len(line.lstrip()) == base_indent
 
 
-def _find_block_start(lines: list[str], start_idx: int, style: CommentStyle) -> int:
+def _find_block_start(lines: Sequence[str], start_idx: int, style: CommentStyle) -> int:
     """Return the line index of the opening '{' of a block, scanning from start_idx."""
     state = _ScanState()
     for line_idx in range(start_idx, len(lines)):
@@ -247,7 +251,7 @@ _BLOCK_STRATEGIES = {
 }
 
 
-def _extract_block(lines: list[str], start_idx: int, style: CommentStyle, block_style: str) -> int:
+def _extract_block(lines: Sequence[str], start_idx: int, style: CommentStyle, block_style: str) -> int:
     """Dispatch to the appropriate block extraction strategy.
 
     Returns the end line index (inclusive).
@@ -509,7 +513,7 @@ def _finalize_params(collected: list[str]) -> list[str]:
     return types
 
 
-def _extract_param_types(lines: list[str], decl_idx: int) -> list[str] | None:
+def _extract_param_types(lines: Sequence[str], decl_idx: int) -> list[str] | None:
     """Extract parameter types from a declaration starting at decl_idx.
 
     Scans forward up to 10 lines to collect the full parameter list.
@@ -543,13 +547,13 @@ def _extract_param_types(lines: list[str], decl_idx: int) -> list[str] | None:
 def _match_signature(requested: list[str], declared: list[str]) -> bool:
     """Return True if requested parameter types match declared parameter types.
 
-    Comparison is case-insensitive. Supports suffix matching for namespaced types
+    Comparison is case-insensitive; requested types arrive already stripped and lowercased
+    (see _parse_requested_params). Supports suffix matching for namespaced types
     (e.g. 'String' matches 'System.String').
     """
     if len(requested) != len(declared):
         return False
-    for req, decl in zip(requested, declared, strict=True):
-        req_l = req.strip().lower()
+    for req_l, decl in zip(requested, declared, strict=True):
         decl_l = decl.strip().lower()
         if req_l == decl_l or decl_l.endswith("." + req_l):
             continue
@@ -595,8 +599,9 @@ def _parse_symbol_spec(symbol_name: str) -> _SymbolSpec:
 
 
 def _parse_requested_params(signature: str | None, has_parens: bool) -> list[str] | None:
+    # normalized once here rather than per candidate declaration in _match_signature
     if has_parens and signature:
-        return _split_params(signature)
+        return [p.strip().lower() for p in _split_params(signature)]
     return [] if has_parens else None
 
 
@@ -611,7 +616,7 @@ def _count_braces(real: str) -> int:
 
 
 def _try_match_at_line(
-    lines: list[str],
+    lines: Sequence[str],
     line_idx: int,
     real_line: str,
     pattern: SymbolPattern,
@@ -638,8 +643,31 @@ def _check_at_depth(line: str, depth: int, restrict_depth: bool, uses_indent_blo
     return _is_at_base_indent(line, base_indent) if uses_indent_blocks else depth == 0
 
 
+class _RealLines:
+    """Real-code text of the lines in a search range, scanned lazily and at most once.
+
+    Every symbol pattern walks the same range; sharing the scan avoids re-running
+    the comment/string state machine once per pattern.
+    """
+
+    def __init__(self, lines: Sequence[str], range_start: int, style: CommentStyle) -> None:
+        self._lines = lines
+        self._range_start = range_start
+        self._style = style
+        self._state = _ScanState()
+        self._real: list[str] = []
+
+    def get(self, line_idx: int) -> str:
+        offset = line_idx - self._range_start
+        while len(self._real) <= offset:
+            real, self._state = _scan_line(self._lines[self._range_start + len(self._real)], self._state, self._style)
+            self._real.append(real)
+        return self._real[offset]
+
+
 def _scan_pattern_in_range(
-    lines: list[str],
+    lines: Sequence[str],
+    real_lines: _RealLines,
     pattern: SymbolPattern,
     regex: re.Pattern[str],
     config: LanguageConfig,
@@ -650,10 +678,9 @@ def _scan_pattern_in_range(
     uses_indent_blocks: bool,
     base_indent: int,
 ) -> tuple[int, int, str] | None:
-    scan_state = _ScanState()
     depth = 0
     for line_idx in range(range_start, range_end + 1):
-        real, scan_state = _scan_line(lines[line_idx], scan_state, config.comment_style)
+        real = real_lines.get(line_idx)
         if _check_at_depth(lines[line_idx], depth, restrict_depth, uses_indent_blocks, base_indent):
             end_idx = _try_match_at_line(lines, line_idx, real, pattern, regex, requested_params, config)
             if end_idx is not None:
@@ -664,7 +691,7 @@ def _scan_pattern_in_range(
 
 
 def _find_symbol_in_range(
-    lines: list[str],
+    lines: Sequence[str],
     name: str,
     config: LanguageConfig,
     range_start: int,
@@ -682,11 +709,13 @@ def _find_symbol_in_range(
     escaped = re.escape(name)
     uses_indent_blocks = all(p.block_style == "indent" for p in config.patterns)
     base_indent = _get_base_indent(lines, range_start, range_end) if (restrict_depth and uses_indent_blocks) else 0
+    real_lines = _RealLines(lines, range_start, config.comment_style)
 
     for pattern in config.patterns:
         regex = re.compile(pattern.regex_template.replace("{name}", escaped))
         result = _scan_pattern_in_range(
             lines,
+            real_lines,
             pattern,
             regex,
             config,
@@ -713,7 +742,7 @@ def _sig_and_parens(spec: _SymbolSpec, is_last: bool) -> tuple[str | None, bool]
 
 
 def _find_with_coalescing(
-    lines: list[str],
+    lines: Sequence[str],
     spec: _SymbolSpec,
     i: int,
     config: LanguageConfig,
@@ -741,8 +770,9 @@ def _find_with_coalescing(
     return None
 
 
+@functools.lru_cache(maxsize=256)
 def get_language_config(file_path: str) -> LanguageConfig | None:
-    """Return the LanguageConfig for the given file path, or None if unsupported."""
+    """Return the LanguageConfig for the given file path, or None if unsupported. Memoized per path."""
     ext = Path(file_path).suffix.lstrip(".")
     return _EXTENSION_MAP.get(ext)
 
@@ -755,7 +785,19 @@ def extract_symbol(content: str, symbol_name: str, config: LanguageConfig) -> li
 
     Returns the extracted lines, or None if the symbol is not found.
     """
-    lines = content.replace("\r\n", "\n").split("\n")
+    lines = split_lines(content)
+    bounds = locate_symbol(lines, symbol_name, config)
+    if bounds is None:
+        return None
+    return list(lines[bounds[0] : bounds[1]])
+
+
+def locate_symbol(lines: Sequence[str], symbol_name: str, config: LanguageConfig) -> tuple[int, int] | None:
+    """Return the (start, end) slice bounds of a named symbol within lines.
+
+    Callers that only need the joined text can slice their lines once instead of
+    copying them through extract_symbol. Returns None if the symbol is not found.
+    """
     spec = _parse_symbol_spec(symbol_name)
     range_start = 0
     range_end = len(lines) - 1
@@ -775,7 +817,7 @@ def extract_symbol(content: str, symbol_name: str, config: LanguageConfig) -> li
                 range_start = start_idx + 1
             range_end = end_idx
         else:
-            return lines[start_idx : end_idx + 1]
+            return start_idx, end_idx + 1
         i += 1
 
     return None
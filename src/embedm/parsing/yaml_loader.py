@@ -0,0 +1,18 @@
+"""Safe YAML loading shared by directive blocks and config files."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+# libyaml's C loader when PyYAML was built with it; same safe-load semantics as yaml.safe_load
+_YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(text: str) -> Any:
+    """Parse YAML text like yaml.safe_load, using the C loader when available.
+
+    Raises yaml.YAMLError on malformed input.
+    """
+    return yaml.load(text, Loader=_YAML_LOADER)
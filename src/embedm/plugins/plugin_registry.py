@@ -9,16 +9,24 @@ _REQUIRED_ATTRS: tuple[str, ...] = ("name", "directive_type")
 
 
 class _PluginLookup(dict):  # type: ignore[type-arg]
-    """dict subclass that maintains secondary directive_type and deprecated_type → plugin indices."""
+    """dict subclass that maintains secondary directive_type, deprecated_type and module → plugin indices."""
 
     def __init__(self) -> None:
         super().__init__()
         self._by_directive_type: dict[str, PluginBase] = {}
         self._by_deprecated_type: dict[str, PluginBase] = {}
+        self._by_module: dict[str, PluginBase] = {}
 
     def __setitem__(self, key: str, value: PluginBase) -> None:
+        replaced = self.get(key)
         super().__setitem__(key, value)
         self._by_directive_type[value.directive_type] = value
+        if replaced is None:
+            self._by_module.setdefault(value.__class__.__module__, value)
+        else:
+            # the new value takes the replaced key's position, so both modules may now resolve differently
+            self._reindex_module(replaced.__class__.__module__)
+            self._reindex_module(value.__class__.__module__)
         for old_type in value.deprecated_directive_types:
             self._by_deprecated_type[old_type] = value
 
@@ -28,6 +36,16 @@ class _PluginLookup(dict):  # type: ignore[type-arg]
         for old_type in plugin.deprecated_directive_types:
             self._by_deprecated_type.pop(old_type, None)
         super().__delitem__(key)
+        if self._by_module.get(plugin.__class__.__module__) is plugin:
+            self._reindex_module(plugin.__class__.__module__)
+
+    def _reindex_module(self, module: str) -> None:
+        """Point the module index at the first registered plugin from module, or drop it if none is left."""
+        first = next((p for p in self.values() if p.__class__.__module__ == module), None)
+        if first is None:
+            self._by_module.pop(module, None)
+        else:
+            self._by_module[module] = first
 
 
 class PluginRegistry:
@@ -126,3 +144,7 @@ class PluginRegistry:
     def find_plugin_by_directive_type(self, directive_type: str) -> PluginBase | None:
         """Find a plugin that handles the given directive type."""
         return self.lookup._by_directive_type.get(directive_type)
+
+    def find_plugin_by_module(self, module: str) -> PluginBase | None:
+        """Find the plugin defined in the given module (e.g. 'embedm_plugins.file_plugin')."""
+        return self.lookup._by_module.get(module)
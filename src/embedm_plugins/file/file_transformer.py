@@ -61,9 +61,13 @@ def _compile_passes(
     context: PluginContext,
     plugin_sequence: tuple[str, ...],
 ) -> list[str | Directive]:
-    """Run one pass per directive type in plugin_sequence order, replacing each type before the next runs."""
+    """Run one pass per directive type in plugin_sequence order, replacing each type before the next runs.
+
+    Passes for directive types that do not occur in the document are skipped.
+    """
     if plugin_sequence:
-        for directive_type in plugin_sequence:
+        present_types = {item.type for item in resolved if isinstance(item, Directive)}
+        for directive_type in tuple(t for t in plugin_sequence if t in present_types):
             resolved = _resolve_directives(resolved, child_lookup, context, directive_type)
         return resolved
     return _resolve_directives(resolved, child_lookup, context)
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from embedm.parsing.symbol_parser import LanguageConfig, extract_symbol
+from embedm.parsing.extraction import split_lines
+from embedm.parsing.symbol_parser import LanguageConfig, locate_symbol
 
 
 @dataclass
@@ -21,5 +22,9 @@ class SymbolTransformer:
 
     def execute(self, params: SymbolParams) -> str | None:
         """Return the extracted symbol lines as a string, or None if not found."""
-        lines = extract_symbol(params.content, params.symbol_name, params.config)
-        return "\n".join(lines) if lines is not None else None
+        lines = split_lines(params.content)
+        bounds = locate_symbol(lines, params.symbol_name, params.config)
+        if bounds is None:
+            return None
+        # join straight from the line tuple; the slice is the only copy of the symbol's lines
+        return "\n".join(lines[bounds[0] : bounds[1]])
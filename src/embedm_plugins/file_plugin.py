@@ -126,11 +126,12 @@ class FilePlugin(PluginBase):
         line_range = plan_node.directive.options.get("lines")
         symbol = plan_node.directive.options.get("symbol")
 
-        settings = (
-            context.plugin_config.plugin_settings.get(self.__class__.__module__, {}) if context.plugin_config else {}
-        )
-        region_start = settings.get("region_start", DEFAULT_REGION_START)
-        region_end = settings.get("region_end", DEFAULT_REGION_END)
+        # region markers are only resolved when a region is requested; lines and symbol skip them
+        region_start, region_end = DEFAULT_REGION_START, DEFAULT_REGION_END
+        if region and context.plugin_config:
+            settings = context.plugin_config.plugin_settings.get(self.__class__.__module__, {})
+            region_start = settings.get("region_start", DEFAULT_REGION_START)
+            region_end = settings.get("region_end", DEFAULT_REGION_END)
 
         content = _apply_extraction(compiled, source_path, region, line_range, symbol, region_start, region_end)
         if isinstance(content, Status):
@@ -144,9 +145,9 @@ class FilePlugin(PluginBase):
         compiled_dir = context.plugin_config.compiled_dir if context.plugin_config else ""
         header = _build_header(source_path, compiled_dir, title, show_line_range, show_link, line_range)
 
-        is_markdown = Path(source_path).suffix.lower() in _MARKDOWN_EXTENSIONS
-        if not is_markdown:
-            ext = Path(source_path).suffix.lstrip(".") or "text"
+        suffix = Path(source_path).suffix
+        if suffix.lower() not in _MARKDOWN_EXTENSIONS:
+            ext = suffix.lstrip(".") or "text"
             return f"{header}```{ext}\n{content.rstrip()}\n```"
 
         return f"{header}{content}"
@@ -225,7 +226,8 @@ def _relative_link_path(source_path: str, compiled_dir: str) -> str:
     if not compiled_dir:
         return Path(source_path).name
     try:
-        return Path(os.path.relpath(source_path, compiled_dir)).as_posix()
+        # relpath output is already normalized; only the separator needs converting
+        return os.path.relpath(source_path, compiled_dir).replace(os.sep, "/")
     except ValueError:
         return Path(source_path).name
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -24,6 +24,21 @@ from embedm_plugins.query_path.query_path_transformer import QueryPathTransforme
 
 _SUPPORTED_EXTENSIONS: frozenset[str] = frozenset({"json", "yaml", "yml", "xml", "toml"})
 _EXT_TO_LANG_TAG: dict[str, str] = {"json": "json", "yaml": "yaml", "yml": "yaml", "xml": "xml", "toml": "toml"}
+# per-extension parser and parse-error template; unknown extensions fall back to XML
+_PARSERS: dict[str, Callable[[str], Any]] = {
+    "json": normalize_json.normalize,
+    "yaml": normalize_yaml.normalize,
+    "yml": normalize_yaml.normalize,
+    "toml": normalize_toml.normalize,
+    "xml": normalize_xml.normalize,
+}
+_PARSE_ERRORS: dict[str, str] = {
+    "json": str_resources.err_query_path_invalid_json,
+    "yaml": str_resources.err_query_path_invalid_yaml,
+    "yml": str_resources.err_query_path_invalid_yaml,
+    "toml": str_resources.err_query_path_invalid_toml,
+    "xml": str_resources.err_query_path_invalid_xml,
+}
 
 
 @dataclass
@@ -40,23 +55,11 @@ def _get_ext(source: str) -> str:
 
 
 def _parse(content: str, ext: str) -> Any:
-    if ext == "json":
-        return normalize_json.normalize(content)
-    if ext in ("yaml", "yml"):
-        return normalize_yaml.normalize(content)
-    if ext == "toml":
-        return normalize_toml.normalize(content)
-    return normalize_xml.normalize(content)
+    return _PARSERS.get(ext, _PARSERS["xml"])(content)
 
 
 def _parse_error_message(ext: str, exc: Exception) -> str:
-    if ext == "json":
-        return str(str_resources.err_query_path_invalid_json.format(exc=exc))
-    if ext in ("yaml", "yml"):
-        return str(str_resources.err_query_path_invalid_yaml.format(exc=exc))
-    if ext == "toml":
-        return str(str_resources.err_query_path_invalid_toml.format(exc=exc))
-    return str(str_resources.err_query_path_invalid_xml.format(exc=exc))
+    return str(_PARSE_ERRORS.get(ext, str_resources.err_query_path_invalid_xml).format(exc=exc))
 
 
 class QueryPathPlugin(PluginBase):
@@ -5,47 +5,64 @@ from collections import Counter
 
 _MIN_SENTENCE_WORDS = 3
 
+# markdown stripping patterns, applied in this order by clean_text
+_FENCED_CODE = re.compile(r"```+.*?```+", re.DOTALL)
+_BLOCKQUOTE_MARKER = re.compile(r"^>\s?", re.MULTILINE)
+_HEADING_MARKER = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+_BOLD_ITALIC_STARS = re.compile(r"\*{1,3}(.*?)\*{1,3}")
+_BOLD_ITALIC_UNDERSCORES = re.compile(r"(?<!\w)_{1,3}(.*?)_{1,3}(?!\w)")
+_IMAGE = re.compile(r"!\[[^\]]*\]\([^\)]*\)")
+_LINK = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
+_BULLET_MARKER = re.compile(r"^\s*[-*+]\s+", re.MULTILINE)
+_NUMBERED_MARKER = re.compile(r"^\s*\d+\.\s+", re.MULTILINE)
+_HORIZONTAL_WHITESPACE = re.compile(r"[ \t]+")
+
+# block, sentence and word boundaries
+_BLOCK_BREAK = re.compile(r"\n{2,}")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD = re.compile(r"\b[a-z]+\b")
+
 
 def clean_text(text: str) -> str:
     """Strip markdown syntax unsuitable for summarisation: code blocks, tables, formatting."""
     # Remove fenced code blocks (``` ... ```)
-    text = re.sub(r"```+.*?```+", "", text, flags=re.DOTALL)
+    text = _FENCED_CODE.sub("", text)
     # Remove table rows (lines starting with |)
     lines = [line for line in text.splitlines() if not line.strip().startswith("|")]
     text = "\n".join(lines)
     # Remove blockquote markers
-    text = re.sub(r"^>\s?", "", text, flags=re.MULTILINE)
+    text = _BLOCKQUOTE_MARKER.sub("", text)
     # Remove heading markers
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
+    text = _HEADING_MARKER.sub("", text)
     # Remove bold / italic markers
-    text = re.sub(r"\*{1,3}(.*?)\*{1,3}", r"\1", text)
-    text = re.sub(r"(?<!\w)_{1,3}(.*?)_{1,3}(?!\w)", r"\1", text)
+    text = _BOLD_ITALIC_STARS.sub(r"\1", text)
+    text = _BOLD_ITALIC_UNDERSCORES.sub(r"\1", text)
     # Remove links and images: [text](url) → text, ![alt](url) → remove
-    text = re.sub(r"!\[[^\]]*\]\([^\)]*\)", "", text)
-    text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
+    text = _IMAGE.sub("", text)
+    text = _LINK.sub(r"\1", text)
     # Remove list markers
-    text = re.sub(r"^\s*[-*+]\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^\s*\d+\.\s+", "", text, flags=re.MULTILINE)
+    text = _BULLET_MARKER.sub("", text)
+    text = _NUMBERED_MARKER.sub("", text)
     # Collapse horizontal whitespace only — preserve newlines as sentence boundaries
-    return re.sub(r"[ \t]+", " ", text).strip()
+    return _HORIZONTAL_WHITESPACE.sub(" ", text).strip()
 
 
 def split_into_blocks(text: str, max_blocks: int) -> list[list[str]]:
     """Split cleaned text on blank lines into blocks; return per-block sentence lists."""
-    raw_blocks = re.split(r"\n{2,}", text)
+    raw_blocks = _BLOCK_BREAK.split(text)
     capped = raw_blocks[:max_blocks] if max_blocks > 0 else raw_blocks
     return [sentences for block in capped if (sentences := block_to_sentences(block))]
 
 
 def block_to_sentences(text: str) -> list[str]:
     """Split a block on punctuation boundaries and newlines, filtering short fragments."""
-    raw = re.split(r"(?<=[.!?])\s+|\n+", text)
+    raw = _SENTENCE_BREAK.split(text)
     return [s.strip() for s in raw if len(tokenize(s)) >= _MIN_SENTENCE_WORDS]
 
 
 def tokenize(text: str) -> list[str]:
     """Return lowercase ASCII word tokens."""
-    return re.findall(r"\b[a-z]+\b", text.lower())
+    return _WORD.findall(text.lower())
 
 
 def score_frequency(sentences: list[str], stopwords: frozenset[str]) -> list[tuple[float, int]]:
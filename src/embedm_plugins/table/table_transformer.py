@@ -190,11 +190,13 @@ def _render_table(
     max_cell_length: int,
 ) -> str:
     lines = ["| " + " | ".join(headers) + " |"]
-    lines.append("| " + " | ".join("---" for _ in headers) + " |")
+    lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
     for row in rows:
         cells = [_format_cell(row.get(h, ""), date_format, null_string, max_cell_length) for h in headers]
         lines.append("| " + " | ".join(cells) + " |")
-    return "\n".join(lines) + "\n"
+    # the empty last entry gives the trailing newline without copying the joined table again
+    lines.append("")
+    return "\n".join(lines)
 
 
 def _format_cell(value: str, date_format: str, null_string: str, max_cell_length: int) -> str:
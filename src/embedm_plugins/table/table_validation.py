@@ -37,8 +37,28 @@ class JsonValidationParams:
 
 
 def _parse_delimited(content: str, delimiter: str) -> list[Row]:
-    reader = csv.DictReader(io.StringIO(content), delimiter=delimiter)
-    return [{str(k): (str(v) if v is not None else "") for k, v in row.items()} for row in reader]
+    """Parse delimited rows keyed by the header row, with the same results as csv.DictReader.
+
+    Rows that match the header width, the common case, are zipped straight into a dict.
+    """
+    reader = csv.reader(io.StringIO(content), delimiter=delimiter)
+    header = next(reader, None)
+    if header is None:
+        return []
+    width = len(header)
+    return [
+        dict(zip(header, row, strict=True)) if len(row) == width else _ragged_row(header, row) for row in reader if row
+    ]
+
+
+def _ragged_row(header: list[str], row: list[str]) -> Row:
+    # as DictReader: surplus cells are listed under a "None" key, missing cells become ""
+    result = dict(zip(header, row, strict=False))
+    if len(row) > len(header):
+        result["None"] = str(row[len(header) :])
+    else:
+        result.update(dict.fromkeys(header[len(row) :], ""))
+    return result
 
 
 def _parse_json_rows(content: str) -> tuple[list[Row], list[Status]]:
@@ -12,6 +12,13 @@ START_FRAGMENT_KEY = "start_fragment"
 
 TOC_OPTION_KEY_TYPES = {START_FRAGMENT_KEY: int, MAX_DEPTH_KEY: int, ADD_SLUGS_KEY: bool}
 
+# ATX heading line; MULTILINE and [^\S\n] let one pattern match a single line or scan a whole fragment
+_HEADING_PATTERN = re.compile(r"^(#{1,6})[^\S\n]+(.+)$", re.MULTILINE)
+
+# slug rules; \w is unicode-aware, so non-ASCII letters survive and non-ASCII symbols are dropped
+_SLUG_SPECIAL_CHARS = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATORS = re.compile(r"[\s_]+")
+
 
 @dataclass
 class ToCParams:
@@ -25,16 +32,13 @@ class ToCTransformer(TransformerBase[ToCParams]):
     params_type = ToCParams
 
     def execute(self, params: ToCParams) -> str:
-        toc_lines = []
+        # entries from every fragment go into one list that is joined once
+        toc_lines: list[str] = []
         heading_counts: dict[str, int] = {}  # Track duplicate headings for unique anchors
 
         for fragment in params.parent_document[params.start_fragment :]:
             if isinstance(fragment, str):
-                fragment_content = self._parse_str_fragment(
-                    fragment, params.max_depth, heading_counts, params.add_slugs
-                )
-                if fragment_content:
-                    toc_lines.append(fragment_content)
+                toc_lines.extend(self._parse_str_fragment(fragment, params.max_depth, heading_counts, params.add_slugs))
 
         if toc_lines:
             toc_content = "\n".join(toc_lines)
@@ -48,23 +52,36 @@ class ToCTransformer(TransformerBase[ToCParams]):
         max_depth: int,
         heading_counts: dict[str, int],
         add_slugs: bool,
-    ) -> str:
+    ) -> Iterator[str]:
+
+        for level, text in self._iter_headings(content, max_depth):
+            yield self._build_toc_line(level, text, heading_counts, add_slugs)
 
-        toc_lines = []
+    def _iter_headings(self, content: str, max_depth: int) -> Iterator[tuple[int, str]]:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
 
-        for line in self._iter_visible_lines(content):
-            heading = self._extract_heading(line, max_depth)
-            if heading is None:
+        # without a fence marker every line is visible, so one regex pass covers the fragment
+        if "```" not in content:
+            matches: Iterator[re.Match[str] | None] = _HEADING_PATTERN.finditer(content)
+        else:
+            # only lines starting with '#' can be headings; the rest skip the regex
+            matches = (
+                _HEADING_PATTERN.match(line) for line in self._iter_visible_lines(content) if line.startswith("#")
+            )
+
+        for match in matches:
+            if match is None:
                 continue
 
-            level, text = heading
-            toc_line = self._build_toc_line(level, text, heading_counts, add_slugs)
-            toc_lines.append(toc_line)
+            level = len(match.group(1))
 
-        return "\n".join(toc_lines)
+            if level > max_depth:
+                continue
+
+            yield level, match.group(2).strip()
 
     def _iter_visible_lines(self, content: str) -> Iterator[str]:
-        lines = content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        lines = content.split("\n")
 
         is_in_fence = False
         fence_marker = ""
@@ -75,18 +92,6 @@ class ToCTransformer(TransformerBase[ToCParams]):
             if not is_fence_line and not is_in_fence:
                 yield line
 
-    def _extract_heading(self, line: str, max_depth: int) -> tuple[int, str] | None:
-        match = re.match(r"^(#{1,6})\s+(.+)$", line)
-        if not match:
-            return None
-
-        level = len(match.group(1))
-
-        if level > max_depth:
-            return None
-
-        return level, match.group(2).strip()
-
     def _build_toc_line(
         self,
         level: int,
@@ -97,11 +102,11 @@ class ToCTransformer(TransformerBase[ToCParams]):
 
         slug = slugify(text)
 
-        if slug in heading_counts:
-            heading_counts[slug] += 1
-            slug = f"{slug}-{heading_counts[slug]}"
-        else:
-            heading_counts[slug] = 0
+        # one lookup and one store per heading; repeats of a slug get -1, -2, ... suffixes
+        count = heading_counts.get(slug, -1) + 1
+        heading_counts[slug] = count
+        if count:
+            slug = f"{slug}-{count}"
 
         indent = "  " * (level - 1)
 
@@ -129,7 +134,6 @@ def slugify(text: str) -> str:
     Generates a GitHub-style anchor slug from a heading
     """
     result = text.lower().strip()
-    result = re.sub(r"[^\w\s-]", "", result)  # Remove special chars
-    result = re.sub(r"[\s_]+", "-", result)  # Replace spaces with hyphens
-    result = re.sub(r"^-+|-+$", "", result)  # Remove leading/trailing hyphens
-    return result
+    result = _SLUG_SPECIAL_CHARS.sub("", result)  # Remove special chars
+    result = _SLUG_SEPARATORS.sub("-", result)  # Replace spaces with hyphens
+    return result.strip("-")  # Remove leading/trailing hyphens
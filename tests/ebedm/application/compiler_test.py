@@ -0,0 +1,55 @@
+"""Tests for compiler helpers: directive pass ordering."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from embedm.application.compiler import _get_directive_sequence, build_directive_sequence
+from embedm.application.configuration import Configuration
+from embedm.application.embedm_context import EmbedmContext
+from embedm.infrastructure.file_cache import FileCache
+from embedm.plugins.plugin_registry import PluginRegistry
+
+
+def _make_context(tmp_path: Path) -> EmbedmContext:
+    config = Configuration()
+    file_cache = FileCache(config.max_file_size, config.max_memory, [str(tmp_path)])
+    registry = PluginRegistry()
+    registry.load_plugins(enabled_modules=set(config.plugin_sequence))
+    return EmbedmContext(config=config, file_cache=file_cache, plugin_registry=registry)
+
+
+# --- build_directive_sequence ---
+
+
+def test_build_directive_sequence_follows_plugin_sequence(tmp_path: Path) -> None:
+    context = _make_context(tmp_path)
+
+    result = build_directive_sequence(context.config.plugin_sequence, context.plugin_registry)
+
+    assert result[0] == "file"
+    assert result[-1] == "toc"
+
+
+def test_build_directive_sequence_appends_unlisted_plugins(tmp_path: Path) -> None:
+    context = _make_context(tmp_path)
+
+    result = build_directive_sequence(["embedm_plugins.toc_plugin"], context.plugin_registry)
+
+    assert result[0] == "toc"
+    assert set(result) == {p.directive_type for p in context.plugin_registry.lookup.values()}
+
+
+# --- _get_directive_sequence ---
+
+
+def test_get_directive_sequence_resolves_once_per_context(tmp_path: Path) -> None:
+    context = _make_context(tmp_path)
+
+    with patch("embedm.application.compiler.build_directive_sequence", wraps=build_directive_sequence) as mock_build:
+        first = _get_directive_sequence(context)
+        second = _get_directive_sequence(context)
+
+    assert first == second
+    assert mock_build.call_count == 1
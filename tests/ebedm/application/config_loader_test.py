@@ -2,6 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+import yaml
+
+from embedm.application import config_loader
 from embedm.application.config_loader import (
     discover_config,
     generate_default_config,
@@ -14,6 +18,7 @@ from embedm.application.configuration import (
     DEFAULT_MAX_MEMORY,
     DEFAULT_PLUGIN_SEQUENCE,
     DEFAULT_ROOT_DIRECTIVE_TYPE,
+    Configuration,
 )
 from embedm.domain.status_level import StatusLevel
 
@@ -34,6 +39,22 @@ def test_generate_creates_yaml_file(tmp_path: Path) -> None:
     assert "plugin_sequence" in content
 
 
+def test_generated_config_loads_as_defaults(tmp_path: Path) -> None:
+    path, _ = generate_default_config(str(tmp_path))
+
+    config, errors = load_config_file(path)
+
+    assert errors == []
+    assert config.plugin_sequence == DEFAULT_PLUGIN_SEQUENCE
+
+
+def test_default_config_text_parses_to_defaults() -> None:
+    config, errors = config_loader._parse_config(yaml.safe_load(config_loader._DEFAULT_CONFIG_YAML))
+
+    assert errors == []
+    assert config == Configuration()
+
+
 def test_generate_existing_file_returns_error(tmp_path: Path) -> None:
     (tmp_path / CONFIG_FILE_NAME).write_text("existing", encoding="utf-8")
 
@@ -104,6 +125,21 @@ def test_load_empty_config_uses_defaults(tmp_path: Path) -> None:
     assert config.max_file_size == DEFAULT_MAX_FILE_SIZE
 
 
+def test_load_whitespace_only_config_skips_yaml(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config_file = tmp_path / CONFIG_FILE_NAME
+    config_file.write_text("  \n\t\n", encoding="utf-8")
+
+    def _fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("yaml parser should not run for a blank config")
+
+    monkeypatch.setattr(config_loader.yaml, "load", _fail)
+
+    config, errors = load_config_file(str(config_file))
+
+    assert not errors
+    assert config.max_recursion == Configuration().max_recursion
+
+
 def test_load_unknown_keys_returns_warning(tmp_path: Path) -> None:
     config_file = tmp_path / CONFIG_FILE_NAME
     config_file.write_text("max_recursion: 3\nunknown_key: value\n", encoding="utf-8")
@@ -146,6 +182,16 @@ def test_load_invalid_yaml_returns_error(tmp_path: Path) -> None:
     assert "parse" in errors[0].description.lower()
 
 
+def test_load_python_tag_is_rejected(tmp_path: Path) -> None:
+    config_file = tmp_path / CONFIG_FILE_NAME
+    config_file.write_text("max_recursion: !!python/object/apply:os.getpid []\n", encoding="utf-8")
+
+    _, errors = load_config_file(str(config_file))
+
+    assert len(errors) == 1
+    assert "parse" in errors[0].description.lower()
+
+
 def test_load_memory_not_greater_than_file_size_returns_error(tmp_path: Path) -> None:
     config_file = tmp_path / CONFIG_FILE_NAME
     config_file.write_text("max_file_size: 8192\nmax_memory: 4096\n", encoding="utf-8")
@@ -270,6 +316,18 @@ def test_load_plugin_configuration_inner_not_dict_returns_error(tmp_path: Path)
     assert any("embedm_plugins.file_plugin" in e.description for e in errors)
 
 
+def test_load_plugin_sequence_non_string_entry_returns_error(tmp_path: Path) -> None:
+    config_file = tmp_path / CONFIG_FILE_NAME
+    config_file.write_text("plugin_sequence:\n  - embedm_plugins.file_plugin\n  - 42\n", encoding="utf-8")
+
+    config, errors = load_config_file(str(config_file))
+
+    assert len(errors) == 1
+    assert errors[0].level == StatusLevel.ERROR
+    assert "plugin_sequence" in errors[0].description
+    assert config.plugin_sequence == DEFAULT_PLUGIN_SEQUENCE
+
+
 # --- discover_config ---
 
 
@@ -293,6 +351,15 @@ def test_discover_returns_none_when_absent(tmp_path: Path) -> None:
     assert result is None
 
 
+def test_discover_finds_config_generated_after_a_miss(tmp_path: Path) -> None:
+    input_file = str(tmp_path / "input.md")
+    assert discover_config(input_file) is None
+
+    config_path, _ = generate_default_config(str(tmp_path))
+
+    assert discover_config(input_file) == config_path
+
+
 # --- line_endings ---
 
 
@@ -5,7 +5,12 @@ from __future__ import annotations
 from pathlib import Path
 
 from embedm.infrastructure.file_util import expand_directory_input, glob_base
+from embedm.application.configuration import Configuration
+from embedm.application.embedm_context import EmbedmContext
+from embedm.application.orchestration import _plan_all_files
 from embedm.application.plan_tree import collect_embedded_sources
+from embedm.infrastructure.file_cache import FileCache
+from embedm.plugins.plugin_registry import PluginRegistry
 from embedm.domain.directive import Directive
 from embedm.domain.plan_node import PlanNode
 from embedm.domain.status_level import Status, StatusLevel
@@ -67,6 +72,21 @@ def test_expand_mid_path_double_star_pattern(tmp_path: Path) -> None:
     assert any("nested.md" in p for p in result)
 
 
+def test_expand_double_star_matches_rglob(tmp_path: Path) -> None:
+    deep = tmp_path / "sub" / "deeper"
+    deep.mkdir(parents=True)
+    (tmp_path / "a.md").write_text("a")
+    (tmp_path / "sub" / "b.txt").write_text("b")
+    (deep / "c.md").write_text("c")
+    (tmp_path / "link").symlink_to(tmp_path / "sub", target_is_directory=True)
+
+    result = expand_directory_input(str(tmp_path / "**"))
+
+    # symlinked directories are not descended, as with Path.rglob
+    assert result == sorted(str(p) for p in tmp_path.rglob("*.md"))
+    assert len(result) == 2
+
+
 def test_expand_empty_directory(tmp_path: Path) -> None:
     result = expand_directory_input(str(tmp_path))
 
@@ -153,3 +173,25 @@ def test_collect_embedded_sources_no_children() -> None:
     sources = collect_embedded_sources(root)
 
     assert len(sources) == 0
+
+
+# --- _plan_all_files ---
+
+
+def test_plan_all_files_excludes_files_embedded_by_later_files(tmp_path: Path) -> None:
+    part = tmp_path / "a_part.md"
+    part.write_text("part\n")
+    main = tmp_path / "b_main.md"
+    main.write_text(f"```yaml embedm\ntype: file\nsource: {part.name}\n```\n")
+    config = Configuration()
+    registry = PluginRegistry()
+    registry.load_plugins(enabled_modules=set(config.plugin_sequence))
+    context = EmbedmContext(
+        config=config,
+        file_cache=FileCache(config.max_file_size, config.max_memory, [str(tmp_path)]),
+        plugin_registry=registry,
+    )
+
+    targets = _plan_all_files([str(part), str(main)], config, context)
+
+    assert [file_path for file_path, _ in targets] == [str(main)]
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from embedm.application.configuration import Configuration
 from embedm.application.verification import VerifyStatus, apply_line_endings, verify_file_output
 
@@ -88,3 +90,22 @@ def test_verify_file_output_crlf_stale_when_disk_is_lf(tmp_path: Path) -> None:
     output_path.write_bytes("line one\nline two\n".encode("utf-8"))
     status = verify_file_output("line one\nline two\n", str(output_path), _config("crlf"))
     assert status == VerifyStatus.STALE
+
+
+def test_verify_file_output_size_mismatch_is_stale(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    output_path = tmp_path / "out.md"
+    output_path.write_bytes(b"content that is much longer than the result\n")
+
+    def _fail_read(_self: Path) -> bytes:
+        raise AssertionError("file should not be read")
+
+    monkeypatch.setattr(Path, "read_bytes", _fail_read)
+    status = verify_file_output("short\n", str(output_path), _config())
+    assert status == VerifyStatus.STALE
+
+
+def test_verify_file_output_multibyte_up_to_date(tmp_path: Path) -> None:
+    output_path = tmp_path / "out.md"
+    output_path.write_bytes("naïve → ✓\n".encode())
+    status = verify_file_output("naïve → ✓\n", str(output_path), _config())
+    assert status == VerifyStatus.UP_TO_DATE
@@ -371,6 +371,29 @@ def test_create_plan_two_directives_same_source_produce_two_children(tmp_path: P
     assert plan.children[1].directive.source == str(shared)
 
 
+def test_create_plan_repeated_nested_source_is_not_a_cycle(tmp_path: Path):
+    """Sibling embeds of the same nested file are planned independently and leave ancestors unchanged."""
+    leaf = tmp_path / "leaf.md"
+    leaf.write_text("leaf content\n")
+    shared = tmp_path / "shared.md"
+    shared.write_text(f"```yaml embedm\ntype: file_embed\nsource: {leaf}\n```\n")
+
+    context = _make_context(tmp_path)
+    _register_plugin(context, "file_embed")
+    directive = Directive(type="root")
+    block = f"```yaml embedm\ntype: file_embed\nsource: {shared}\n```\n"
+    ancestors = {"root.md"}
+
+    plan = create_plan(directive, block + block, depth=0, context=context, ancestors=ancestors)
+
+    assert ancestors == {"root.md"}
+    assert plan.children is not None
+    assert len(plan.children) == 2
+    for child in plan.children:
+        assert child.children is not None
+        assert child.children[0].document is not None
+
+
 # --- normalize_input ---
 
 
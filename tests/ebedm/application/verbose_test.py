@@ -75,6 +75,15 @@ def test_worst_status_label_fatal() -> None:
     assert _worst_status_label(statuses) == "FATAL"
 
 
+def test_worst_status_label_empty_is_ok() -> None:
+    assert _worst_status_label([]) == "OK"
+
+
+def test_worst_status_label_order_independent() -> None:
+    statuses = [Status(StatusLevel.FATAL, "f"), Status(StatusLevel.OK, "ok"), Status(StatusLevel.WARNING, "w")]
+    assert _worst_status_label(statuses) == "FATAL"
+
+
 # --- verbose_summary ---
 
 
@@ -1,6 +1,8 @@
 import os
 from pathlib import Path
 
+import pytest
+
 from embedm.domain.status_level import StatusLevel
 from embedm.infrastructure.cache_events import CacheEvent
 from embedm.infrastructure.events import EventDispatcher
@@ -44,6 +46,25 @@ def test_validate_skips_checks_when_already_cached(tmp_path: Path):
     assert errors == []
 
 
+def test_get_file_after_validate_reports_file_removed_since(tmp_path: Path):
+    test_file = tmp_path / "readme.md"
+    test_file.write_text("hello")
+
+    cache = FileCache(
+        max_file_size=1024,
+        memory_limit=4096,
+        allowed_paths=[str(tmp_path)],
+    )
+
+    assert cache.validate(str(test_file)) == []
+    os.remove(str(test_file))
+    content, errors = cache.get_file(str(test_file))
+
+    assert content is None
+    assert len(errors) == 1
+    assert errors[0].level == StatusLevel.ERROR
+
+
 # --- get_file: happy path ---
 
 
@@ -112,6 +133,32 @@ def test_get_file_evicts_lru_when_memory_full(tmp_path: Path):
     assert cache.get_file_state(str(file_c)) == FileState.LOADED
 
 
+def test_get_file_normalizes_newlines(tmp_path: Path):
+    test_file = tmp_path / "mixed.md"
+    test_file.write_bytes(b"one\r\ntwo\rthree\n")
+    cache = FileCache(
+        max_file_size=1024,
+        memory_limit=4096,
+        allowed_paths=[str(tmp_path)],
+    )
+    content, errors = cache.get_file(str(test_file))
+
+    assert errors == []
+    assert content == "one\ntwo\nthree\n"
+
+
+def test_get_file_serves_added_content_without_disk(tmp_path: Path):
+    path = str(tmp_path / "<stdin>")
+    cache = FileCache(max_file_size=1024, memory_limit=4096, allowed_paths=[str(tmp_path)])
+
+    cache.add_content(path, "from memory")
+    content, errors = cache.get_file(path)
+
+    assert errors == []
+    assert content == "from memory"
+    assert not Path(path).exists()
+
+
 # --- get_file_state: happy path ---
 
 
@@ -281,6 +328,19 @@ def test_validate_file_does_not_exist(tmp_path: Path):
     assert errors[0].level == StatusLevel.ERROR
 
 
+def test_validate_directory_is_not_a_file(tmp_path: Path):
+    (tmp_path / "folder").mkdir()
+    cache = FileCache(
+        max_file_size=1024,
+        memory_limit=4096,
+        allowed_paths=[str(tmp_path)],
+    )
+    errors = cache.validate(str(tmp_path / "folder"))
+
+    assert len(errors) == 1
+    assert "does not exist" in errors[0].description
+
+
 def test_validate_file_exceeds_max_size(tmp_path: Path):
     test_file = tmp_path / "large.md"
     test_file.write_text("x" * 100)
@@ -509,6 +569,71 @@ def test_file_inside_allowed_directory_is_accepted(tmp_path: Path):
     assert errors == []
 
 
+def test_many_allowed_roots_match_only_true_ancestors(tmp_path: Path):
+    """With several allowed roots, a file is accepted only when one of them is an ancestor."""
+    roots = [tmp_path / name for name in ("a", "a-b", "a.b", "b")]
+    for root in roots:
+        root.mkdir()
+    inside = tmp_path / "a-b" / "nested" / "file.txt"
+    inside.parent.mkdir()
+    inside.write_text("ok")
+    outside = tmp_path / "ab" / "file.txt"
+    outside.parent.mkdir()
+    outside.write_text("no")
+
+    cache = FileCache(max_file_size=1024, memory_limit=4096, allowed_paths=[str(r) for r in roots])
+
+    assert cache.validate(str(inside)) == []
+    assert any(s.level.name == "FATAL" for s in cache.validate(str(outside)))
+
+
+def test_filesystem_root_as_allowed_path(tmp_path: Path):
+    """An allowed path that already ends in a separator (the filesystem root) still covers its subtree."""
+    test_file = tmp_path / "readme.md"
+    test_file.write_text("hello")
+
+    cache = FileCache(max_file_size=1024, memory_limit=4096, allowed_paths=[tmp_path.anchor])
+
+    assert cache.validate(str(test_file)) == []
+
+
+def test_relative_allowed_path_resolved_at_construction(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Relative allowed paths are resolved once, against the working directory at construction time."""
+    project = tmp_path / "project"
+    project.mkdir()
+    project_file = project / "readme.md"
+    project_file.write_text("hello")
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+
+    monkeypatch.chdir(project)
+    cache = FileCache(max_file_size=1024, memory_limit=4096, allowed_paths=["./**"])
+    monkeypatch.chdir(elsewhere)
+
+    assert cache.validate(str(project_file)) == []
+
+
+def test_path_resolved_once_across_checks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Repeated access checks for the same path string reuse the first resolution."""
+    test_file = tmp_path / "readme.md"
+    test_file.write_text("hello")
+    cache = FileCache(max_file_size=1024, memory_limit=4096, allowed_paths=[str(tmp_path)])
+
+    calls: list[Path] = []
+    original_resolve = Path.resolve
+
+    def _counting_resolve(self: Path, strict: bool = False) -> Path:
+        calls.append(self)
+        return original_resolve(self, strict)
+
+    monkeypatch.setattr(Path, "resolve", _counting_resolve)
+    cache.validate(str(test_file))
+    cache.validate(str(test_file))
+    cache.write("updated", str(test_file))
+
+    assert len(calls) == 1
+
+
 # --- CacheEvent dispatch ---
 
 
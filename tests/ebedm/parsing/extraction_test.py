@@ -1,6 +1,13 @@
 import pytest
 
-from embedm.parsing.extraction import extract_line_range, extract_region, is_valid_line_range
+from embedm.parsing.extraction import (
+    DEFAULT_REGION_END,
+    DEFAULT_REGION_START,
+    _region_index,
+    extract_line_range,
+    extract_region,
+    is_valid_line_range,
+)
 
 # ---------------------------------------------------------------------------
 # extract_region
@@ -82,6 +89,12 @@ def test_extract_region_crlf_line_endings():
     assert lines == ["line"]
 
 
+def test_extract_region_marker_name_must_be_on_marker_line():
+    source = "// md.start:\nr\nline\n// md.end: r\n"
+    lines = extract_region(source, "r")
+    assert lines is None
+
+
 def test_extract_region_empty_body():
     source = "// md.start: empty\n// md.end: empty\n"
     lines = extract_region(source, "empty")
@@ -157,6 +170,14 @@ def test_extract_crlf_content():
     assert extract_line_range(content, "2") == ["b"]
 
 
+def test_extract_range_end_beyond_file_is_clamped():
+    assert extract_line_range(_CONTENT, "5..99") == ["line5", ""]
+
+
+def test_extract_last_line_without_trailing_newline():
+    assert extract_line_range("a\nb\nc", "3") == ["c"]
+
+
 # ---------------------------------------------------------------------------
 # is_valid_line_range
 # ---------------------------------------------------------------------------
@@ -192,3 +213,16 @@ def test_invalid_alpha():
 
 def test_invalid_empty():
     assert not is_valid_line_range("")
+
+
+def test_validate_and_extract_agree_on_range_syntax():
+    for range_str in ("2", "2..3", "4..", "..3", "..", "2-3", "a..b", ""):
+        assert is_valid_line_range(range_str) == (extract_line_range(_CONTENT, range_str) is not None)
+
+
+def test_region_index_maps_every_terminated_region():
+    content = "# md.start: a\nfirst\n# md.end: a\n# md.start: b\nsecond\n# md.end: b\n# md.start: open\n"
+
+    regions = _region_index(content, DEFAULT_REGION_START, DEFAULT_REGION_END)
+
+    assert regions == {"a": (1, 2), "b": (4, 5)}
@@ -1,6 +1,7 @@
 """Tests for symbol_parser — covers C/C++, C#, Java, and Python extraction."""
 import pytest
 
+from embedm.parsing import symbol_parser
 from embedm.parsing.symbol_parser import (
     CSHARP_CONFIG,
     C_CPP_CONFIG,
@@ -8,6 +9,7 @@ from embedm.parsing.symbol_parser import (
     PYTHON_CONFIG,
     extract_symbol,
     get_language_config,
+    locate_symbol,
 )
 
 # ---------------------------------------------------------------------------
@@ -40,6 +42,10 @@ def test_get_language_config_unsupported():
     assert get_language_config("foo.txt") is None
 
 
+def test_get_language_config_uses_suffix_of_full_path():
+    assert get_language_config("src/service.v2.cs") is CSHARP_CONFIG
+
+
 # ---------------------------------------------------------------------------
 # C# extraction
 # ---------------------------------------------------------------------------
@@ -178,6 +184,14 @@ def test_cs_symbol_not_found():
     assert extract_symbol(_CS_CLASS, "NonExistent", CSHARP_CONFIG) is None
 
 
+def test_cs_locate_symbol_matches_extracted_lines():
+    lines = _CS_METHOD.split("\n")
+    bounds = locate_symbol(lines, "Add", CSHARP_CONFIG)
+    assert bounds is not None
+    assert lines[bounds[0] : bounds[1]] == extract_symbol(_CS_METHOD, "Add", CSHARP_CONFIG)
+    assert locate_symbol(lines, "NonExistent", CSHARP_CONFIG) is None
+
+
 def test_cs_brace_in_string_ignored():
     source = """\
 public class Safe
@@ -411,6 +425,13 @@ def test_cs_inner_class_extra_overload_resolved():
     assert any("extra overloaded" in l for l in lines)
 
 
+def test_cs_overload_signature_case_and_spacing_insensitive():
+    """Requested parameter types match regardless of case and surrounding whitespace."""
+    lines = extract_symbol(_CS_INNER_CLASS, "Example.doSomething( STRING ,Int )", CSHARP_CONFIG)
+    assert lines is not None
+    assert any("extra overloaded" in line for line in lines)
+
+
 def test_cs_another_class_method_resolved():
     """AnotherExample.doSomething() must resolve to AnotherExample's method."""
     lines = extract_symbol(_CS_INNER_CLASS, "AnotherExample.doSomething()", CSHARP_CONFIG)
@@ -469,6 +490,22 @@ def test_cs_symbol_inside_line_comment_is_skipped():
     assert any("// real" in l for l in lines)
 
 
+def test_cs_lines_scanned_once_across_all_patterns(monkeypatch: pytest.MonkeyPatch):
+    """A failed lookup tries every pattern but runs the comment scanner once per line."""
+    calls = []
+    original = symbol_parser._scan_line
+
+    def _counting_scan_line(line, state, style):
+        calls.append(line)
+        return original(line, state, style)
+
+    monkeypatch.setattr(symbol_parser, "_scan_line", _counting_scan_line)
+
+    assert extract_symbol(_CS_LINE_COMMENT, "missing", CSHARP_CONFIG) is None
+    assert len(CSHARP_CONFIG.patterns) > 1
+    assert len(calls) == _CS_LINE_COMMENT.count("\n") + 1
+
+
 # ---------------------------------------------------------------------------
 # Python extraction
 # ---------------------------------------------------------------------------
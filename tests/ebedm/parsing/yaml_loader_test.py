@@ -0,0 +1,19 @@
+import pytest
+import yaml
+
+from embedm.parsing.yaml_loader import load_yaml
+
+
+def test_load_yaml_matches_safe_load():
+    text = "type: file\nsource: a.md\noptions:\n  - 1\n  - two\n"
+    assert load_yaml(text) == yaml.safe_load(text)
+
+
+def test_load_yaml_rejects_python_tags():
+    with pytest.raises(yaml.YAMLError):
+        load_yaml("!!python/object/apply:os.system ['echo']")
+
+
+def test_load_yaml_malformed_raises():
+    with pytest.raises(yaml.YAMLError):
+        load_yaml(":\n  - :\n  invalid: [")
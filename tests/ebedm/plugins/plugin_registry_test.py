@@ -330,3 +330,51 @@ def test_resolve_directive_type_unknown_returns_unchanged():
 
     assert canonical == "unknown_type"
     assert is_deprecated is False
+
+
+# --- find_plugin_by_module ---
+
+
+def test_find_plugin_by_module_returns_matching_plugin():
+    registry = PluginRegistry()
+    plugin = _WithDeprecated()
+    registry.lookup["new_plugin"] = plugin
+
+    assert registry.find_plugin_by_module(_WithDeprecated.__module__) is plugin
+
+
+def test_find_plugin_by_module_returns_none_when_not_found():
+    registry = PluginRegistry()
+    registry.lookup["new_plugin"] = _WithDeprecated()
+
+    assert registry.find_plugin_by_module("embedm_plugins.unknown_plugin") is None
+
+
+def test_find_plugin_by_module_removed_on_delete():
+    registry = PluginRegistry()
+    registry.lookup["new_plugin"] = _WithDeprecated()
+
+    del registry.lookup["new_plugin"]
+
+    assert registry.find_plugin_by_module(_WithDeprecated.__module__) is None
+
+
+def test_find_plugin_by_module_follows_overwritten_key():
+    registry = PluginRegistry()
+    registry.lookup["new_plugin"] = _WithDeprecated()
+    replacement = _WithDeprecated()
+
+    registry.lookup["new_plugin"] = replacement
+
+    assert registry.find_plugin_by_module(_WithDeprecated.__module__) is replacement
+
+
+def test_find_plugin_by_module_falls_back_to_remaining_plugin_on_delete():
+    registry = PluginRegistry()
+    registry.lookup["first"] = _WithDeprecated()
+    second = _WithDeprecated()
+    registry.lookup["second"] = second
+
+    del registry.lookup["first"]
+
+    assert registry.find_plugin_by_module(_WithDeprecated.__module__) is second
@@ -158,6 +158,24 @@ def test_nested_recursion(tmp_path: Path):
     assert "Root end\n" in result
 
 
+def test_identical_source_embeds_each_render(tmp_path: Path):
+    child = tmp_path / "child.md"
+    child.write_text("Child has\n```yaml embedm\ntype: hello_world\n```\n")
+    embed = f"```yaml embedm\ntype: file\nsource: {child}\n```\n"
+
+    source = tmp_path / "input.md"
+    source.write_text(f"{embed}between\n{embed}")
+
+    context = _make_context(tmp_path)
+    hello = _register_mock_plugin(context, "hello_world", transform_result="HW")
+    plan = plan_file(str(source), context)
+
+    result = FilePlugin().transform(plan, [], PluginContext(context.file_cache, context.plugin_registry))
+
+    assert result == "Child has\nHWbetween\nChild has\nHW"
+    assert hello.transform.call_count == 2
+
+
 def test_source_with_mixed_directives(tmp_path: Path):
     child = tmp_path / "child.md"
     child.write_text("Child has\n```yaml embedm\ntype: hello_world\n```\ninside\n")
@@ -276,6 +294,32 @@ def test_toc_above_file_embed_sees_embedded_headings(tmp_path: Path):
     assert result.index("- Chapter from file") < result.index("## Chapter from file")
 
 
+def test_passes_skipped_for_absent_directive_types(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Only directive types that occur in the document get a compile pass."""
+    from embedm_plugins.file import file_transformer
+
+    source = tmp_path / "input.md"
+    source.write_text("Before\n```yaml embedm\ntype: hello_world\n```\nAfter\n")
+
+    context = _make_context(tmp_path)
+    _register_mock_plugin(context, "hello_world", transform_result="hello!")
+    plan = plan_file(str(source), context)
+
+    passes: list[str | None] = []
+    original = file_transformer._resolve_directives
+
+    def _recording_resolve(resolved, child_lookup, ctx, directive_type=None):
+        passes.append(directive_type)
+        return original(resolved, child_lookup, ctx, directive_type)
+
+    monkeypatch.setattr(file_transformer, "_resolve_directives", _recording_resolve)
+    plugin_config = PluginConfiguration(max_embed_size=0, max_recursion=10, plugin_sequence=("file", "hello_world"))
+    result = FilePlugin().transform(plan, [], PluginContext(context.file_cache, context.plugin_registry, plugin_config))
+
+    assert passes == ["hello_world"]
+    assert result == "Before\nhello!After\n"
+
+
 def test_single_pass_fallback_without_plugin_sequence(tmp_path: Path):
     """Without a plugin_sequence, compilation falls back to single-pass (backward compat)."""
     child = tmp_path / "child.md"
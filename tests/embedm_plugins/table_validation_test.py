@@ -32,6 +32,17 @@ def test_tsv_valid_returns_rows():
     assert result.normalized_data == [{"name": "Alice", "age": "30"}, {"name": "Bob", "age": "25"}]
 
 
+def test_csv_ragged_and_blank_rows_parse_like_dict_reader():
+    content = "name,age\nAlice\n\nBob,25,extra\n"
+    result = CsvTsvTableValidation().validate(
+        CsvTsvValidationParams(content=content, delimiter=",", select="", order_by="")
+    )
+    assert result.normalized_data == [
+        {"name": "Alice", "age": ""},
+        {"name": "Bob", "age": "25", "None": "['extra']"},
+    ]
+
+
 def test_csv_empty_returns_error():
     result = CsvTsvTableValidation().validate(
         CsvTsvValidationParams(content="name,age\n", delimiter=",", select="", order_by="")
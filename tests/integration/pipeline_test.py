@@ -2,9 +2,11 @@
 
 from pathlib import Path
 
+import pytest
+
 from embedm.application.configuration import Configuration
 from embedm.application.embedm_context import EmbedmContext
-from embedm.application.planner import plan_file
+from embedm.application.planner import plan_content, plan_file
 from embedm.application.application_resources import str_resources
 from embedm.domain.status_level import StatusLevel
 from embedm.infrastructure.file_cache import FileCache
@@ -35,6 +37,20 @@ def _compile(file_path: Path, context: EmbedmContext) -> str:
     return plugin.transform(plan, [], PluginContext(context.file_cache, context.plugin_registry))
 
 
+def test_stdin_content_compiles(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Content planned from memory compiles as a markdown document without a file behind its root source."""
+    monkeypatch.chdir(tmp_path)
+    context = _build_context(tmp_path)
+
+    plan = plan_content("Before\n```yaml embedm\ntype: hello_world\n```\nAfter\n", context)
+    assert plan.document is not None
+    plugin = context.plugin_registry.find_plugin_by_directive_type(plan.directive.type)
+    assert plugin is not None
+    result = plugin.transform(plan, [], PluginContext(context.file_cache, context.plugin_registry))
+
+    assert result == "Before\nhello embedded world!After\n"
+
+
 def test_hello_world_directive_compiles(tmp_path: Path):
     """A file with text and a hello_world block produces the expected output."""
     source = tmp_path / "input.md"
@@ -43,8 +59,7 @@ def test_hello_world_directive_compiles(tmp_path: Path):
     context = _build_context(tmp_path)
     result = _compile(source, context)
 
-    assert "Before\n" in result
-    assert "hello embedded world!" in result
+    assert result == "Before\nhello embedded world!After\n"
     assert "After\n" in result
 
 